@@ -0,0 +1,229 @@
+# ===  PROJECT LIBRARY IMPORT STATEMENTS === #
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Mount, Route
+from starlette.concurrency import run_in_threadpool
+from a2wsgi import WSGIMiddleware
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+from sqlalchemy.pool import StaticPool
+
+from datetime import datetime
+import json
+import os
+
+from app import (
+    app, db, cache, LRUCache, cache_key, cache_entry, fast_query, fast_rows, order_summary_query,
+    make_etag, product_etag, collection_fingerprint_query, order_products_fingerprint_query, is_not_modified, prefers_ndjson,
+    caching_headers, catalog_cache_control, ORDER_CACHE_CONTROL,
+    User, Order, Product,
+    user_schema, users_schema, orders_schema, orders_products_schema, product_schema, products_schema, product_lines_schema
+)
+
+# === ASYNC SERVING MODE === #
+# ASGI entry point for I/O-bound traffic: the hot GET endpoints run as asyncio views on an
+# AsyncSession, so a request waiting on the database holds no worker thread.
+# Every other route (writes, pagination, streaming, search, analytics, stats) falls through to the
+# Flask app, which a2wsgi runs in a thread pool. Both share the same models, schemas and cache.
+#
+# Launch:  uvicorn asgi:application --host 0.0.0.0 --port 8000
+#     or:  python asgi.py  (WEB_CONCURRENCY=<n> for n workers)
+# Each worker has its own LRU cache and would serve stale entries after another worker's write,
+# so run more than one worker only with a shared cache (CACHE_BACKEND=redis).
+#
+# The async engine uses the same database as app.py with an async driver swapped in.
+# Set ASYNC_SQLALCHEMY_DATABASE_URI (or ECOMMERCE_ASYNC_SQLALCHEMY_DATABASE_URI) to override it.
+# In-memory SQLite is not shared between the two engines, so use a SQLite file for local runs.
+
+# Async drivers for each backend (pip install aiomysql / aiosqlite)
+ASYNC_DRIVERS = {"mysql": "mysql+aiomysql", "sqlite": "sqlite+aiosqlite"}
+
+# Query parameters only the sync views handle
+SYNC_ONLY_ARGS = {"limit", "after", "format"}
+PRODUCT_SEARCH_ARGS = {"q", "mode", "min_price", "max_price", "sort"}
+
+def async_database_url():
+    if app.config.get("ASYNC_SQLALCHEMY_DATABASE_URI"):
+        return app.config["ASYNC_SQLALCHEMY_DATABASE_URI"]
+    # Use the resolved sync URL so SQLite paths point at the same instance/ file
+    with app.app_context():
+        url = db.engine.url
+    return url.set(drivername=ASYNC_DRIVERS[url.get_backend_name()])
+
+def async_engine_options(url):
+    if url.get_backend_name() != "sqlite":
+        return dict(app.config["SQLALCHEMY_ENGINE_OPTIONS"])
+    if url.database in (None, "", ":memory:"):
+        return {"poolclass": StaticPool}
+    return {}
+
+database_url = async_database_url()
+async_engine = create_async_engine(database_url, **async_engine_options(database_url))
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+# Same bytes as Flask's jsonify outside debug mode
+def json_response(data, status=200):
+    body = json.dumps(data, sort_keys=True, separators=(",", ":")) + "\n"
+    return Response(body, status_code=status, media_type="application/json")
+
+# Cache calls block (a Redis round trip), so only the in-process LRU is called on the event loop
+async def cache_call(method, *args):
+    if isinstance(cache, LRUCache):
+        return method(*args)
+    return await run_in_threadpool(method, *args)
+
+async def async_cached_entry(session, model, schema, id):
+    key = cache_key(model, id)
+    entry = await cache_call(cache.get, key)
+    if entry is None:
+        obj = await session.get(model, id)
+        if not obj:
+            return None
+        entry = cache_entry(obj, schema)
+        await cache_call(cache.set, key, entry)
+    return entry
+
+# Async counterpart of app.conditional_response: build is awaited only when the client's copy is stale
+async def async_conditional_response(request, etag, last_modified, cache_control, build):
+    headers = caching_headers(etag, last_modified, cache_control)
+    if is_not_modified(request.headers.get("if-none-match"), request.headers.get("if-modified-since"), etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    response = await build()
+    if response.status_code == 200:
+        response.headers.update(headers)
+    return response
+
+async def async_fast_dump(session, model, schema, *criteria):
+    result = await session.execute(fast_query(model, schema, *criteria))
+    return fast_rows(model, schema, result)
+
+flask_asgi = WSGIMiddleware(app)
+
+# Wraps an async handler as a raw ASGI endpoint so requests it can't serve (sync-only query parameters,
+# or an Accept header preferring NDJSON) are handed to Flask unchanged
+class AsyncView:
+    def __init__(self, handler, sync_args=()):
+        self.handler = handler
+        self.sync_args = SYNC_ONLY_ARGS | set(sync_args)
+
+    async def __call__(self, scope, receive, send):
+        request = Request(scope, receive)
+        if self.sync_args & request.query_params.keys() or prefers_ndjson(request.headers.get("accept")):
+            await flask_asgi(scope, receive, send)
+            return
+        async with AsyncSessionLocal() as session:
+            response = await self.handler(request, session)
+        await response(scope, receive, send)
+
+# === ASYNC API ENDPOINTS === #
+## USER ENDPOINTS ##
+# ● GET /users: Retrieve all users
+async def get_users(request, session):
+    users = await async_fast_dump(session, User, users_schema)
+    if not users:
+        return json_response({"message": "No users in the database"}, 400)
+    return json_response(users)
+
+# ● GET /users/<id>: Retrieve a user by ID
+async def get_user(request, session):
+    id = request.path_params["id"]
+    entry = await async_cached_entry(session, User, user_schema, id)
+    if not entry:
+        return json_response({"message": f"{id} is an invalid user ID"}, 400)
+    return json_response(entry["data"])
+
+## PRODUCT ENDPOINTS ##
+# ● GET /products: Retrieve all products
+async def get_products(request, session):
+    count, max_id, versions, last_modified = (await session.execute(collection_fingerprint_query(Product))).one()
+    # Same ETag as the Flask view (request.full_path there is "/products?" with no query string)
+    etag = make_etag("products", "/products?", count, max_id, versions, last_modified)
+
+    async def build():
+        return json_response(await async_fast_dump(session, Product, products_schema))
+    # ETag only, as in the Flask view
+    return await async_conditional_response(request, etag, None, catalog_cache_control(), build)
+
+# ● GET /products/<id>: Retrieve a product by ID
+async def get_product(request, session):
+    id = request.path_params["id"]
+    entry = await async_cached_entry(session, Product, product_schema, id)
+    if not entry:
+        return json_response({"message": f"Invalid product ID {id} entered"}, 400)
+
+    etag = product_etag(id, entry)
+    last_modified = datetime.fromisoformat(entry["updated_at"])
+
+    async def build():
+        return json_response(entry["data"])
+    return await async_conditional_response(request, etag, last_modified, catalog_cache_control(), build)
+
+## ORDER ENDPOINTS ##
+# ● GET /orders/user/<user_id>: Get all orders for a user (?expand=products supported)
+async def get_user_orders(request, session):
+    user_id = request.path_params["user_id"]
+    if request.query_params.get("expand") == "products":
+        query = select(Order).filter_by(user_id=user_id).order_by(Order.id).options(selectinload(Order.lines))
+        orders = orders_products_schema.dump((await session.execute(query)).scalars().all())
+    else:
+        orders = await async_fast_dump(session, Order, orders_schema, Order.user_id == user_id)
+    if not orders:
+        return json_response({"message": f"User ID {user_id} not found"}, 400)
+    return json_response(orders)
+
+# ● GET /orders/<order_id>/products: Get all products for an order
+async def get_order_products(request, session):
+    order_id = request.path_params["order_id"]
+    fingerprint = (await session.execute(order_products_fingerprint_query(order_id))).one_or_none()
+    if not fingerprint:
+        return json_response({"message": f"Order ID {order_id} not found"}, 400)
+    etag = make_etag("order_products", order_id, *fingerprint)
+    last_modified = max(filter(None, (fingerprint[1], fingerprint[4])))
+
+    async def build():
+        order = await session.get(Order, order_id, options=[selectinload(Order.lines)])
+        if not order.lines:
+            return json_response({"message": f"No products were found in order ID {order_id}"}, 400)
+        return json_response(product_lines_schema.dump(order.lines))
+    return await async_conditional_response(request, etag, last_modified, ORDER_CACHE_CONTROL, build)
+
+# ● GET /orders/<order_id>/summary: Item count and total price for an order
+async def get_order_summary(request, session):
+    order_id = request.path_params["order_id"]
+    order = await session.get(Order, order_id)
+    if not order:
+        return json_response({"message": f"Order ID {order_id} not found"}, 400)
+    item_count, total = (await session.execute(order_summary_query(order_id))).one()
+    return json_response({"order_id": order_id, "user_id": order.user_id, "item_count": int(item_count), "total": float(total)})
+
+# === ASGI APPLICATION === #
+# Large responses from the async views are gzipped; Flask responses arrive already compressed and pass through
+application = Starlette(middleware=[Middleware(GZipMiddleware, minimum_size=app.config["COMPRESS_MIN_SIZE"])], routes=[
+    Route("/users", AsyncView(get_users), methods=["GET"]),
+    Route("/users/{id:int}", AsyncView(get_user), methods=["GET"]),
+    Route("/products", AsyncView(get_products, PRODUCT_SEARCH_ARGS), methods=["GET"]),
+    Route("/products/{id:int}", AsyncView(get_product), methods=["GET"]),
+    Route("/orders/user/{user_id:int}", AsyncView(get_user_orders), methods=["GET"]),
+    Route("/orders/{order_id:int}/products", AsyncView(get_order_products), methods=["GET"]),
+    Route("/orders/{order_id:int}/summary", AsyncView(get_order_summary), methods=["GET"]),
+    Mount("/", app=flask_asgi),
+])
+
+# === LAUNCH API === #
+# Production server for the async mode (the sync app can be served with: gunicorn app:app)
+if __name__ == "__main__":
+    import uvicorn
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+    if workers > 1 and isinstance(cache, LRUCache):
+        raise SystemExit(f"WEB_CONCURRENCY={workers} needs a shared cache: set CACHE_BACKEND=redis or run one worker")
+    uvicorn.run(
+        "asgi:application",
+        host=os.environ.get("HOST", "0.0.0.0"),
+        port=int(os.environ.get("PORT", 8000)),
+        workers=workers
+    )
@@ -0,0 +1,107 @@
+# ===  PROJECT LIBRARY IMPORT STATEMENTS === #
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# === ANALYTICS BENCHMARK === #
+# Seeds a SQLite file with orders and order lines, then times GET /orders/<id>/summary and the /analytics
+# endpoints through the Flask test client. Order dates are spread evenly over 2025. Seeding 10M lines takes a few minutes and ~1GB of disk; the file
+# is reused on later runs with the same sizes:
+#   python benchmarks/analytics.py --lines 10000000
+# Point --database-uri at a seeded MySQL database to benchmark it instead.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SEED_BATCH = 100000
+START_DATE = datetime(2025, 1, 1)
+
+def seed(path, lines, lines_per_order, products):
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE IF NOT EXISTS seed_marker (lines INTEGER, lines_per_order INTEGER, products INTEGER)")
+        if connection.execute("SELECT * FROM seed_marker").fetchone() == (lines, lines_per_order, products):
+            return
+    sys.path.insert(0, ROOT)
+    os.environ["ECOMMERCE_SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{path}"
+    from app import app, db
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+
+    orders = -(-lines // lines_per_order)
+    now = datetime.now().isoformat(" ")
+    random.seed(0)
+    with sqlite3.connect(path) as connection:
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+        connection.execute("INSERT INTO app_users (name, address, email, version, updated_at) VALUES ('Bench', '1 Main St', 'bench@example.com', 1, ?)", (now,))
+        connection.executemany(
+            "INSERT INTO app_products (product_name, price, version, updated_at) VALUES (?, ?, 1, ?)",
+            ((f"product {i}", i % 1000 + 0.99, now) for i in range(products)))
+        for start in range(0, orders, SEED_BATCH):
+            connection.executemany(
+                "INSERT INTO app_orders (id, order_date, user_id, version, updated_at) VALUES (?, ?, 1, 1, ?)",
+                ((id, (START_DATE + timedelta(days=365 * id / orders)).isoformat(" "), now)
+                 for id in range(start + 1, min(start + SEED_BATCH, orders) + 1)))
+        written = 0
+        while written < lines:
+            batch = []
+            for line in range(written, min(written + SEED_BATCH, lines)):
+                order_id = line // lines_per_order + 1
+                product_id = (order_id * 7919 + (line % lines_per_order) * 104729) % products + 1
+                batch.append((order_id, product_id, random.randint(1, 5)))
+            connection.executemany("INSERT OR IGNORE INTO order_product (order_id, product_id, quantity) VALUES (?, ?, ?)", batch)
+            written += len(batch)
+        connection.execute("ANALYZE")
+        connection.execute("DELETE FROM seed_marker")
+        connection.execute("INSERT INTO seed_marker VALUES (?, ?, ?)", (lines, lines_per_order, products))
+
+def timed(client, url, repeat):
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get(url() if callable(url) else url)
+        latencies.append(time.perf_counter() - start)
+        assert response.status_code == 200, response.get_json()
+    latencies.sort()
+    return {"p50_ms": round(latencies[len(latencies) // 2] * 1000, 2), "max_ms": round(latencies[-1] * 1000, 2)}
+
+def main():
+    parser = argparse.ArgumentParser(description="Latency of the order summary and analytics endpoints on a large dataset")
+    parser.add_argument("--lines", type=int, default=1000000, help="Order lines to seed")
+    parser.add_argument("--lines-per-order", type=int, default=5)
+    parser.add_argument("--products", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5, help="Requests per analytics endpoint")
+    parser.add_argument("--database", default=os.path.join(tempfile.gettempdir(), "ecommerce_analytics_bench.db"))
+    parser.add_argument("--database-uri", help="Benchmark an already seeded database instead of SQLite")
+    args = parser.parse_args()
+
+    if args.database_uri:
+        os.environ["ECOMMERCE_SQLALCHEMY_DATABASE_URI"] = args.database_uri
+    else:
+        start = time.perf_counter()
+        seed(args.database, args.lines, args.lines_per_order, args.products)
+        print(f"seeded in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+        os.environ["ECOMMERCE_SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{args.database}"
+    sys.path.insert(0, ROOT)
+    from app import app
+
+    orders = -(-args.lines // args.lines_per_order)
+    month = (START_DATE + timedelta(days=90)).date()
+    urls = {
+        "summary": lambda: f"/orders/{random.randint(1, orders)}/summary",
+        "top_products": "/analytics/products/top?limit=10",
+        "top_products_month": f"/analytics/products/top?limit=10&from={month}&to={month + timedelta(days=30)}",
+        "revenue": "/analytics/revenue",
+        "revenue_month": f"/analytics/revenue?from={month}&to={month + timedelta(days=30)}",
+    }
+    client = app.test_client()
+    results = {name: timed(client, url, args.repeat * 100 if name == "summary" else args.repeat) for name, url in urls.items()}
+    print(json.dumps({"lines": args.lines, "orders": orders, **results}, indent=2))
+
+if __name__ == "__main__":
+    main()
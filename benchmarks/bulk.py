@@ -0,0 +1,60 @@
+# ===  PROJECT LIBRARY IMPORT STATEMENTS === #
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+# === BULK WRITE BENCHMARK === #
+# Rows/sec inserting products through POST /products/bulk (JSON and NDJSON) against one POST /products per row,
+# on a fresh SQLite file per mode, through the Flask test client (no network):
+#   python benchmarks/bulk.py --rows 10000 --chunk-size 1000
+# Use loadtest.py with -X POST --data against a running server to include HTTP overhead.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def product_rows(rows):
+    return [{"product_name": f"product {i}", "price": i % 1000 + 0.99} for i in range(rows)]
+
+def per_row(client, rows, chunk_size):
+    for row in product_rows(rows):
+        response = client.post("/products", json=row)
+        assert response.status_code == 200, response.get_json()
+
+def bulk_json(client, rows, chunk_size):
+    response = client.post(f"/products/bulk?chunk_size={chunk_size}", json=product_rows(rows))
+    assert response.get_json()["inserted"] == rows, response.get_json()
+
+def bulk_ndjson(client, rows, chunk_size):
+    body = "\n".join(json.dumps(row) for row in product_rows(rows))
+    response = client.post(f"/products/bulk?chunk_size={chunk_size}", data=body, content_type="application/x-ndjson")
+    assert response.get_json()["inserted"] == rows, response.get_json()
+
+MODES = {"per-row": per_row, "bulk-json": bulk_json, "bulk-ndjson": bulk_ndjson}
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput of /products/bulk vs per-row POST /products")
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    database = os.path.join(tempfile.mkdtemp(), "bulk_bench.db")
+    os.environ["ECOMMERCE_SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{database}"
+    sys.path.insert(0, ROOT)
+    from app import app, db
+
+    results = {}
+    with app.app_context():
+        client = app.test_client()
+        for name, mode in MODES.items():
+            db.drop_all()
+            db.create_all()
+            start = time.perf_counter()
+            mode(client, args.rows, args.chunk_size)
+            elapsed = time.perf_counter() - start
+            results[name] = {"seconds": round(elapsed, 3), "rows_per_sec": round(args.rows / elapsed, 1)}
+    print(json.dumps({"rows": args.rows, "chunk_size": args.chunk_size, **results}, indent=2))
+
+if __name__ == "__main__":
+    main()
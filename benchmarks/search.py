@@ -0,0 +1,73 @@
+# ===  PROJECT LIBRARY IMPORT STATEMENTS === #
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+# === SEARCH BENCHMARK === #
+# Latency of GET /products?q=...&mode=fulltext on SQLite (the app_products_fts table) and of mode=prefix (a product_name range),
+# through the Flask test client, for a page of 20 and for the full match list. Also times the first search after
+# another process inserts or updates a product. Every name has three of the words below, so a one-word query
+# matches ~15% of the catalog:
+#   python benchmarks/search.py --rows 1000000 --query steel
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORDS = ["red", "green", "blue", "wooden", "steel", "glass", "chair", "table", "lamp", "desk", "shelf", "mug",
+         "apple", "cable", "phone", "charger", "bottle", "jacket", "boot", "scarf"]
+
+def main():
+    parser = argparse.ArgumentParser(description="Product search latency on SQLite")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--query", default="steel", help="Words to search for (prefixes of WORDS)")
+    args = parser.parse_args()
+
+    database = os.path.join(tempfile.mkdtemp(), "search_bench.db")
+    os.environ["ECOMMERCE_SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{database}"
+    sys.path.insert(0, ROOT)
+    from app import app, db
+
+    random.seed(0)
+    with app.app_context():
+        db.create_all()
+    # Written outside the app, as another worker would
+    writer = sqlite3.connect(database)
+    writer.executemany(
+        "INSERT INTO app_products (product_name, price, version, updated_at) VALUES (?, ?, 1, CURRENT_TIMESTAMP)",
+        ((" ".join(random.sample(WORDS, 3)) + f" {i}", i % 1000 + 0.99) for i in range(args.rows)))
+    writer.commit()
+
+    client = app.test_client()
+
+    def once(url):
+        start = time.perf_counter()
+        response = client.get(url)
+        elapsed = time.perf_counter() - start
+        assert response.status_code == 200, response.get_json()
+        return round(elapsed * 1000, 2)
+
+    def p50(url):
+        return sorted(once(url) for _ in range(args.repeat))[args.repeat // 2]
+
+    query = args.query.replace(" ", "+")
+    fulltext = f"/products?q={query}&mode=fulltext&limit=20"
+    results = {"rows": args.rows, "query": args.query,
+               "fulltext_first_ms": once(fulltext), "fulltext_p50_ms": p50(fulltext),
+               "fulltext_all_matches_ms": once(f"/products?q={query}&mode=fulltext"),
+               "prefix_p50_ms": p50(f"/products?q={query}&mode=prefix&limit=20")}
+
+    writer.execute("INSERT INTO app_products (product_name, price, version, updated_at) VALUES (?, 1, 1, CURRENT_TIMESTAMP)", (f"{args.query} new",))
+    writer.commit()
+    results["fulltext_after_insert_ms"] = once(fulltext)
+    writer.execute("UPDATE app_products SET product_name = ?, version = version + 1 WHERE id = 1", (f"{args.query} renamed",))
+    writer.commit()
+    results["fulltext_after_update_ms"] = once(fulltext)
+    results["fulltext_p50_after_writes_ms"] = p50(fulltext)
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
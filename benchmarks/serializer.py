@@ -0,0 +1,56 @@
+# ===  PROJECT LIBRARY IMPORT STATEMENTS === #
+import argparse
+import json
+import os
+import sys
+import time
+
+# === SERIALIZER BENCHMARK === #
+# Objects/sec turning the product table into a JSON response, comparing products_schema.jsonify on ORM objects
+# with the fast path (fast_dump + fast_jsonify), on in-memory SQLite. Each mode includes its query:
+#   python benchmarks/serializer.py --rows 50000 --repeat 5
+# The fast_orjson mode runs only when orjson is installed.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def main():
+    parser = argparse.ArgumentParser(description="Objects/sec of the fast serializer vs the Marshmallow schema")
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per mode; the best run is reported")
+    args = parser.parse_args()
+
+    os.environ["ECOMMERCE_SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    sys.path.insert(0, ROOT)
+    from sqlalchemy import insert, select
+    from app import app, db, fast_dump, fast_jsonify, orjson, Product, products_schema
+
+    def schema_mode():
+        return products_schema.jsonify(db.session.execute(select(Product).order_by(Product.id)).scalars().all())
+
+    def fast_mode():
+        return fast_jsonify(fast_dump(Product, products_schema))
+
+    modes = {"schema": schema_mode, "fast": fast_mode}
+    if orjson is not None:
+        modes["fast_orjson"] = fast_mode
+
+    results = {}
+    with app.app_context(), app.test_request_context():
+        db.create_all()
+        db.session.execute(insert(Product), [{"product_name": f"product {i}", "price": i % 1000 + 0.99} for i in range(args.rows)])
+        db.session.commit()
+        expected = schema_mode().get_data()
+        for name, mode in modes.items():
+            app.config['FAST_JSON_ENCODER'] = name == "fast_orjson"
+            best = float("inf")
+            for _ in range(args.repeat):
+                db.session.expunge_all()
+                start = time.perf_counter()
+                body = mode().get_data()
+                best = min(best, time.perf_counter() - start)
+            results[name] = {"seconds": round(best, 3), "objects_per_sec": round(args.rows / best),
+                             "same_bytes": body == expected}
+    print(json.dumps({"rows": args.rows, **results}, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# ===  PROJECT LIBRARY IMPORT STATEMENTS === #
+import argparse
+import json
+import os
+import resource
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+
+# === STREAMING BENCHMARK === #
+# Peak RSS and time to first byte of GET /products?format=ndjson against the full JSON listing, on a seeded
+# SQLite file. Each mode runs in its own process so ru_maxrss belongs to that mode alone:
+#   python benchmarks/streaming.py --rows 1000000
+# The streamed mode should stay close to the baseline RSS however many rows are seeded.
+# For MySQL, point --database-uri at a seeded database; streams then go through PyMySQL (see README).
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODES = {"ndjson": "/products?format=ndjson", "json": "/products"}
+# The full listing is measured as it was before streaming existed: schema.dump of every ORM row
+MODE_CONFIG = {"ndjson": {}, "json": {"ECOMMERCE_FAST_SERIALIZER": "false"}}
+
+def seed(path, rows):
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE IF NOT EXISTS seed_marker (rows INTEGER)")
+        if connection.execute("SELECT rows FROM seed_marker").fetchone() == (rows,):
+            return
+    sys.path.insert(0, ROOT)
+    os.environ["ECOMMERCE_SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{path}"
+    from app import app, db
+    with app.app_context():
+        db.create_all()
+    with sqlite3.connect(path) as connection:
+        connection.execute("DELETE FROM app_products")
+        connection.executemany(
+            "INSERT INTO app_products (product_name, price, version, updated_at) VALUES (?, ?, 1, CURRENT_TIMESTAMP)",
+            ((f"product {i}", i % 1000 + 0.99) for i in range(rows)))
+        connection.execute("DELETE FROM seed_marker")
+        connection.execute("INSERT INTO seed_marker VALUES (?)", (rows,))
+
+# Runs in a child process: one request, reported as JSON on stdout
+def measure(path):
+    sys.path.insert(0, ROOT)
+    from app import app
+    client = app.test_client()
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    response = client.get(path, buffered=False)
+    first_byte, size = None, 0
+    for chunk in response.response:
+        if first_byte is None:
+            first_byte = time.perf_counter() - start
+        size += len(chunk)
+    response.close()
+    return {
+        "ttfb_ms": round((first_byte or 0) * 1000, 1),
+        "total_ms": round((time.perf_counter() - start) * 1000, 1),
+        "bytes": size,
+        "baseline_rss_mb": round(baseline_kb / 1024, 1),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory and TTFB of NDJSON streaming vs the full listing")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--database", default=os.path.join(tempfile.gettempdir(), "ecommerce_streaming_bench.db"))
+    parser.add_argument("--database-uri", help="Benchmark an already seeded database instead of SQLite")
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(MODES[args.child])))
+        return
+
+    uri = args.database_uri
+    if not uri:
+        seed(args.database, args.rows)
+        uri = f"sqlite:///{args.database}"
+    env = dict(os.environ, ECOMMERCE_SQLALCHEMY_DATABASE_URI=uri)
+    results = {}
+    for mode in MODES:
+        output = subprocess.run([sys.executable, __file__, "--child", mode], env={**env, **MODE_CONFIG[mode]}, check=True,
+                                capture_output=True, text=True).stdout
+        results[mode] = json.loads(output.splitlines()[-1])
+    print(json.dumps({"database": str(uri), **results}, indent=2))
+
+if __name__ == "__main__":
+    main()
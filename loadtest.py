@@ -0,0 +1,238 @@
+# ===  PROJECT LIBRARY IMPORT STATEMENTS === #
+import argparse
+import asyncio
+import json
+import os
+import time
+from urllib.parse import urlsplit
+
+# === LOAD TEST === #
+# Opens N keep-alive connections and sends requests as fast as each connection allows,
+# then reports requests/sec and latency percentiles. Compare the sync and async modes with e.g.:
+#   ECOMMERCE_CACHE_BACKEND=redis gunicorn -w 4 --threads 8 -b 127.0.0.1:5000 app:app
+#   ECOMMERCE_CACHE_BACKEND=redis uvicorn asgi:application --port 8000 --workers 4
+#   python loadtest.py http://127.0.0.1:5000/products/1 -c 1000 -d 30
+#   python loadtest.py http://127.0.0.1:8000/products/1 -c 1000 -d 30
+# 1k connections needs a raised open file limit (ulimit -n 4096) on both sides.
+#
+# --checkout <n> measures whole checkouts of n products (IDs 1..n, user --user-id) instead of single requests
+# ("requests" and the latencies then count checkouts):
+#   python loadtest.py http://127.0.0.1:5000 -c 50 --checkout 50 --flow atomic    # one POST /orders with all items
+#   python loadtest.py http://127.0.0.1:5000 -c 50 --checkout 50 --flow per-item  # POST /orders + one add_product per item
+#
+# --poll simulates clients polling a read endpoint, reporting the bytes received as well:
+#   python loadtest.py http://127.0.0.1:5000/products -c 50 --poll etag   # If-None-Match with the last ETag seen
+#   python loadtest.py http://127.0.0.1:5000/products -c 50 --poll full   # refetch the whole body every time
+# Both send Accept-Encoding (--accept-encoding, default "gzip, br"; pass "" to disable compression).
+#
+# --server-pid <pid> also reports the CPU time the server used during the run (Linux, server on the same host),
+# summed over the process and its descendants so gunicorn/uvicorn workers are included. With --poll this shows
+# the CPU a 304 saves over rebuilding the body:
+#   python loadtest.py http://127.0.0.1:5000/products -c 50 --poll etag --server-pid $(pgrep -of gunicorn)
+
+def build_request(method, host, path, body, headers=None):
+    lines = [f"{method} {path} HTTP/1.1", f"Host: {host}", "Connection: keep-alive"]
+    lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+    if body is not None:
+        lines += ["Content-Type: application/json", f"Content-Length: {len(body)}"]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode() + (body or b"")
+
+async def read_response(reader):
+    status, _ = await read_response_body(reader)
+    return status
+
+# headers, when given, is filled with the lower-cased response headers
+async def read_response_body(reader, headers=None):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("connection closed")
+    status = int(status_line.split()[1])
+    length, chunked = 0, False
+    header_bytes = len(status_line)
+    while True:
+        line = await reader.readline()
+        header_bytes += len(line)
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        name = name.strip().lower()
+        if headers is not None:
+            headers[name] = value.strip()
+        if name == "content-length":
+            length = int(value)
+        elif name == "transfer-encoding" and "chunked" in value.lower():
+            chunked = True
+    if headers is not None:
+        headers[":header-bytes"] = header_bytes
+    body = b""
+    if chunked:
+        while True:
+            size = int((await reader.readline()).strip(), 16)
+            body += (await reader.readexactly(size + 2))[:-2]
+            if size == 0:
+                break
+    else:
+        body = await reader.readexactly(length)
+    return status, body
+
+# One checkout on an open connection: returns the status of the first failed request, or 200
+async def checkout(reader, writer, host, flow, user_id, items, counter):
+    if flow == "atomic":
+        counter[0] += 1
+        body = json.dumps({"user_id": user_id, "products": list(range(1, items + 1))}).encode()
+        writer.write(build_request("POST", host, "/orders", body, {"Idempotency-Key": f"loadtest-{time.time_ns()}-{counter[0]}"}))
+        status, _ = await read_response_body(reader)
+        return status
+
+    writer.write(build_request("POST", host, "/orders", json.dumps({"user_id": user_id}).encode()))
+    status, body = await read_response_body(reader)
+    if status >= 400:
+        return status
+    order_id = json.loads(body)["id"]
+    for product_id in range(1, items + 1):
+        writer.write(build_request("GET", host, f"/orders/{order_id}/add_product/{product_id}", None))
+        status = await read_response(reader)
+        if status >= 400:
+            return status
+    return 200
+
+# One poll on an open connection, sending If-None-Match with the last ETag this connection saw (mode "etag")
+async def poll(reader, writer, host, path, mode, accept_encoding, etags, totals):
+    headers = {"Accept-Encoding": accept_encoding} if accept_encoding else {}
+    if mode == "etag" and etags.get(writer):
+        headers["If-None-Match"] = etags[writer]
+    writer.write(build_request("GET", host, path, None, headers))
+    response_headers = {}
+    status, body = await read_response_body(reader, response_headers)
+    if "etag" in response_headers:
+        etags[writer] = response_headers["etag"]
+    totals["bytes"] += response_headers[":header-bytes"] + len(body)
+    totals["not_modified"] += status == 304
+    return 200 if status == 304 else status
+
+# Each iteration is one request, or one whole checkout when iteration is given
+async def worker(url, request_factory, deadline, latencies, errors, iteration=None):
+    parts = urlsplit(url)
+    while time.perf_counter() < deadline:
+        try:
+            reader, writer = await asyncio.open_connection(parts.hostname, parts.port or 80)
+        except OSError:
+            errors["connect"] = errors.get("connect", 0) + 1
+            await asyncio.sleep(0.1)
+            continue
+        try:
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                if iteration is not None:
+                    status = await iteration(reader, writer)
+                else:
+                    writer.write(request_factory())
+                    status = await read_response(reader)
+                latencies.append(time.perf_counter() - start)
+                if status >= 400:
+                    errors[status] = errors.get(status, 0) + 1
+        except (OSError, ConnectionError, asyncio.IncompleteReadError, ValueError):
+            errors["io"] = errors.get("io", 0) + 1
+        finally:
+            writer.close()
+
+# CPU seconds (user + system) used so far by pid and every process descended from it, read from /proc
+def process_tree_cpu(pid):
+    ticks_per_sec = os.sysconf("SC_CLK_TCK")
+    processes = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as stat:
+                data = stat.read()
+        except OSError:
+            continue
+        # Fields after the parenthesised command name start at field 3 (state): ppid is 4, utime 14, stime 15
+        fields = data[data.rindex(")") + 2:].split()
+        processes[int(entry)] = (int(fields[1]), int(fields[11]) + int(fields[12]))
+    if pid not in processes:
+        raise SystemExit(f"No process with PID {pid}")
+    tree, added = {pid}, True
+    while added:
+        children = {child for child, (parent, _) in processes.items() if parent in tree} - tree
+        tree |= children
+        added = bool(children)
+    return sum(processes[member][1] for member in tree) / ticks_per_sec
+
+# Runs the load test, adding the server's CPU time for the run when server_pid is given
+def run_measured(server_pid, coroutine):
+    cpu_before = process_tree_cpu(server_pid) if server_pid else None
+    start = time.perf_counter()
+    result = asyncio.run(coroutine)
+    elapsed = time.perf_counter() - start
+    result["elapsed_sec"] = round(elapsed, 3)
+    if server_pid:
+        cpu = process_tree_cpu(server_pid) - cpu_before
+        result.update(server_cpu_sec=round(cpu, 2),
+                      server_cpu_ms_per_request=round(cpu * 1000 / max(result["requests"], 1), 3),
+                      server_cpu_utilization=round(cpu / elapsed, 2))
+    return result
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else 0.0
+
+async def run(url, concurrency, duration, request_factory, iteration=None):
+    latencies, errors = [], {}
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*[worker(url, request_factory, deadline, latencies, errors, iteration) for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "url": url,
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "requests_per_sec": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "errors": errors,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP load test for the eCommerce API")
+    parser.add_argument("url")
+    parser.add_argument("-c", "--concurrency", type=int, default=100)
+    parser.add_argument("-d", "--duration", type=float, default=10)
+    parser.add_argument("-X", "--method", default="GET")
+    parser.add_argument("--data", help="JSON request body")
+    parser.add_argument("--checkout", type=int, metavar="ITEMS", help="Run checkouts of ITEMS products instead of single requests")
+    parser.add_argument("--flow", choices=["atomic", "per-item"], default="atomic")
+    parser.add_argument("--user-id", type=int, default=1)
+    parser.add_argument("--poll", choices=["etag", "full"], help="Poll the URL with (etag) or without (full) If-None-Match")
+    parser.add_argument("--accept-encoding", default="gzip, br")
+    parser.add_argument("--server-pid", type=int, help="Report the CPU time used by this server process and its workers")
+    args = parser.parse_args()
+
+    parts = urlsplit(args.url)
+    if args.checkout:
+        counter = [0]
+        iteration = lambda reader, writer: checkout(reader, writer, parts.netloc, args.flow, args.user_id, args.checkout, counter)
+        result = run_measured(args.server_pid, run(args.url, args.concurrency, args.duration, None, iteration))
+        result["flow"] = args.flow
+        result["checkout_items"] = args.checkout
+        print(json.dumps(result, indent=2))
+        return
+
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    if args.poll:
+        etags, totals = {}, {"bytes": 0, "not_modified": 0}
+        iteration = lambda reader, writer: poll(reader, writer, parts.netloc, path, args.poll, args.accept_encoding, etags, totals)
+        result = run_measured(args.server_pid, run(args.url, args.concurrency, args.duration, None, iteration))
+        result.update(poll=args.poll, accept_encoding=args.accept_encoding, not_modified=totals["not_modified"],
+                      bytes_received=totals["bytes"], bytes_per_sec=round(totals["bytes"] / result["elapsed_sec"]),
+                      bytes_per_request=round(totals["bytes"] / max(result["requests"], 1)))
+        print(json.dumps(result, indent=2))
+        return
+
+    body = args.data.encode() if args.data else None
+    request = build_request(args.method, parts.netloc, path, body)
+    print(json.dumps(run_measured(args.server_pid, run(args.url, args.concurrency, args.duration, lambda: request)), indent=2))
+
+if __name__ == "__main__":
+    main()
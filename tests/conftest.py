@@ -0,0 +1,35 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Run against a throwaway SQLite file (in-memory SQLite can't be shared with asgi.py's async engine);
+# must be set before app.py reads its config
+os.environ["ECOMMERCE_SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'test.db')}"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app, cache, db
+
+
+@pytest.fixture
+def client():
+    with app.app_context():
+        db.create_all()
+        cache.clear()
+        yield app.test_client()
+        db.session.remove()
+        db.drop_all()
+
+
+# Call as seed_catalog(products=n, orders=[[1, 2], ...]): user 1, products 1..n priced 1..n, then one order per list
+@pytest.fixture
+def seed_catalog(client):
+    def seed(products, orders=()):
+        client.post("/users", json={"name": "Ada", "address": "1 Main St", "email": "ada@example.com"})
+        response = client.post("/products/bulk", json=[{"product_name": f"product {i}", "price": i + 1} for i in range(products)])
+        assert response.status_code == 200, response.get_json()
+        for product_ids in orders:
+            response = client.post("/orders", json={"user_id": 1, "products": product_ids})
+            assert response.status_code == 200, response.get_json()
+    return seed
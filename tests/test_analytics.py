@@ -0,0 +1,61 @@
+from datetime import datetime
+
+from sqlalchemy import update
+
+from app import Order, db
+
+
+# POST /orders always stamps the current time, so backdate the order afterwards
+def order_on(client, order_date, products):
+    response = client.post("/orders", json={"user_id": 1, "products": products})
+    assert response.status_code == 200, response.get_json()
+    db.session.execute(update(Order).where(Order.id == response.get_json()["id"]).values(order_date=datetime.fromisoformat(order_date)))
+    db.session.commit()
+
+
+def seed_sales(client, seed_catalog):
+    # Products 1..3 cost 1, 2 and 3
+    seed_catalog(products=3)
+    order_on(client, "2026-01-01T00:00:00", [{"product_id": 1, "quantity": 4}, 2])
+    order_on(client, "2026-01-15T12:00:00", [{"product_id": 2, "quantity": 2}])
+    order_on(client, "2026-02-01T00:00:00", [{"product_id": 3, "quantity": 5}])
+
+
+def test_order_summary_weights_by_quantity(client, seed_catalog):
+    seed_sales(client, seed_catalog)
+    assert client.get("/orders/1/summary").get_json() == {"order_id": 1, "user_id": 1, "item_count": 5, "total": 6.0}
+
+
+def test_order_summary_of_an_empty_order_is_zero(client, seed_catalog):
+    seed_catalog(products=1)
+    order_on(client, "2026-01-01T00:00:00", [])
+    assert client.get("/orders/1/summary").get_json() == {"order_id": 1, "user_id": 1, "item_count": 0, "total": 0.0}
+    assert client.get("/orders/2/summary").status_code == 400
+
+
+def test_top_products_rank_by_units_sold(client, seed_catalog):
+    seed_sales(client, seed_catalog)
+    top = client.get("/analytics/products/top").get_json()
+    assert [(product["product_id"], product["units_sold"], product["revenue"]) for product in top] == [
+        (3, 5, 15.0), (1, 4, 4.0), (2, 3, 6.0)
+    ]
+    assert [product["product_id"] for product in client.get("/analytics/products/top?limit=1").get_json()] == [3]
+
+
+def test_date_range_includes_from_and_excludes_to(client, seed_catalog):
+    seed_sales(client, seed_catalog)
+    january = client.get("/analytics/revenue?from=2026-01-01&to=2026-02-01").get_json()
+    assert (january["order_count"], january["item_count"], january["revenue"]) == (2, 7, 10.0)
+
+    top = client.get("/analytics/products/top?from=2026-01-15T12:00:00&to=2026-02-01").get_json()
+    assert [(product["product_id"], product["units_sold"]) for product in top] == [(2, 2)]
+
+    everything = client.get("/analytics/revenue").get_json()
+    assert (everything["order_count"], everything["item_count"], everything["revenue"]) == (3, 12, 25.0)
+
+
+def test_date_range_rejects_bad_and_timezone_aware_bounds(client, seed_catalog):
+    seed_sales(client, seed_catalog)
+    for query in ["from=yesterday", "to=2026-13-01", "from=2026-01-01T00:00:00%2B05:00", "to=2026-02-01T00:00:00Z"]:
+        assert client.get(f"/analytics/revenue?{query}").status_code == 400, query
+        assert client.get(f"/analytics/products/top?{query}").status_code == 400, query
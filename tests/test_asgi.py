@@ -0,0 +1,88 @@
+import pytest
+from starlette.testclient import TestClient
+
+import asgi
+
+
+# Every route the async views serve, with requests that succeed and ones that hit their error paths
+ASYNC_URLS = [
+    "/users", "/users/1", "/users/99",
+    "/products", "/products/1", "/products/99",
+    "/orders/user/1", "/orders/user/1?expand=products", "/orders/user/99",
+    "/orders/1/products", "/orders/3/products", "/orders/99/products",
+    "/orders/1/summary", "/orders/99/summary",
+]
+VALIDATED_URLS = ["/products", "/products/1", "/orders/1/products"]
+
+
+@pytest.fixture
+def async_client(client, seed_catalog):
+    seed_catalog(products=3, orders=[[1, {"product_id": 2, "quantity": 3}], [3]])
+    client.post("/orders", json={"user_id": 1})
+    with TestClient(asgi.application) as async_client:
+        yield async_client
+
+
+# Records which requests the async views hand to the Flask app
+@pytest.fixture
+def handed_to_flask(monkeypatch):
+    paths = []
+    flask_asgi = asgi.flask_asgi
+
+    async def recording_flask_asgi(scope, receive, send):
+        paths.append(scope["path"] + ("?" + scope["query_string"].decode() if scope["query_string"] else ""))
+        await flask_asgi(scope, receive, send)
+    monkeypatch.setattr(asgi, "flask_asgi", recording_flask_asgi)
+    return paths
+
+
+@pytest.mark.parametrize("url", ASYNC_URLS)
+def test_async_views_match_flask(async_client, client, handed_to_flask, url):
+    async_response = async_client.get(url)
+    flask_response = client.get(url)
+
+    assert handed_to_flask == []
+    assert async_response.status_code == flask_response.status_code
+    assert async_response.content == flask_response.get_data()
+    assert async_response.headers.get("etag") == flask_response.headers.get("ETag")
+    assert async_response.headers.get("last-modified") == flask_response.headers.get("Last-Modified")
+    assert async_response.headers.get("cache-control") == flask_response.headers.get("Cache-Control")
+
+
+@pytest.mark.parametrize("url", VALIDATED_URLS)
+def test_async_views_answer_304_for_a_matching_etag(async_client, client, url):
+    etag = client.get(url).headers["ETag"]
+    response = async_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert async_client.get(url, headers={"If-None-Match": 'W/"stale"'}).status_code == 200
+
+
+@pytest.mark.parametrize("url", [
+    "/users?limit=1", "/products?after=1", "/orders/user/1?format=ndjson",
+    "/products?q=product", "/products?min_price=2", "/products?sort=-price",
+])
+def test_sync_only_parameters_are_handed_to_flask(async_client, client, handed_to_flask, url):
+    response = async_client.get(url)
+    assert handed_to_flask == [url]
+    assert response.status_code == 200
+    assert response.content == client.get(url).get_data()
+
+
+def test_ndjson_accept_header_is_handed_to_flask(async_client, handed_to_flask):
+    response = async_client.get("/products", headers={"Accept": "application/x-ndjson"})
+    assert handed_to_flask == ["/products"]
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert len(response.text.splitlines()) == 3
+
+
+def test_other_methods_and_routes_reach_flask(async_client, client):
+    created = async_client.post("/products", json={"product_name": "lamp", "price": 4})
+    assert created.status_code == 200
+    assert created.json()["id"] == 4
+
+    assert async_client.put("/products/4", json={"product_name": "desk lamp", "price": 5}).status_code == 200
+    assert async_client.get("/products/4").json()["product_name"] == "desk lamp"
+    assert async_client.delete("/products/4").status_code == 200
+    assert async_client.get("/products/4").status_code == 400
+    assert async_client.get("/analytics/revenue").json()["order_count"] == 2
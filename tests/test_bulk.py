@@ -0,0 +1,75 @@
+import json
+
+from sqlalchemy import select
+
+from app import User, db
+
+
+def user(name, email):
+    return {"name": name, "address": "1 Main St", "email": email}
+
+
+def test_bulk_users_report_errors_per_row(client):
+    client.post("/users", json=user("Ada", "ada@example.com"))
+    response = client.post("/users/bulk?chunk_size=2", json=[
+        user("Bob", "bob@example.com"),
+        {"name": "No email"},
+        user("Ada again", "ada@example.com"),
+        user("Cy", "cy@example.com"),
+        user("Bob again", "bob@example.com"),
+    ])
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["inserted"] == 2
+    assert set(body["errors"]) == {"1", "2", "4"}
+    assert "email" in body["errors"]["1"]
+    assert body["errors"]["2"] == {"email": ["ada@example.com is already in use"]}
+    assert body["errors"]["4"] == {"email": ["bob@example.com is already in use"]}
+    assert db.session.execute(select(User.name).order_by(User.id)).scalars().all() == ["Ada", "Bob", "Cy"]
+
+
+def test_bulk_products_accept_ndjson(client):
+    rows = [{"product_name": "lamp", "price": 10}, {"product_name": "mug"}, {"product_name": "desk", "price": 99}]
+    response = client.post("/products/bulk", data="\n".join(json.dumps(row) for row in rows) + "\n",
+                           content_type="application/x-ndjson")
+    assert response.status_code == 200
+    assert response.get_json()["inserted"] == 2
+    assert list(response.get_json()["errors"]) == ["1"]
+    assert [product["product_name"] for product in client.get("/products").get_json()] == ["lamp", "desk"]
+
+
+def test_bulk_batch_with_only_bad_rows_is_rejected(client):
+    response = client.post("/products/bulk", json=[{"price": 1}, {"product_name": "x", "price": "free"}])
+    assert response.status_code == 400
+    assert response.get_json()["inserted"] == 0
+    assert set(response.get_json()["errors"]) == {"0", "1"}
+
+
+def test_bulk_body_and_chunk_size_are_validated(client):
+    assert client.post("/users/bulk", json={"name": "not a list"}).status_code == 400
+    assert client.post("/products/bulk", data="{not json\n", content_type="application/x-ndjson").status_code == 400
+    for chunk_size in ["0", "-1", "ten"]:
+        response = client.post(f"/products/bulk?chunk_size={chunk_size}", json=[{"product_name": "lamp", "price": 1}])
+        assert response.status_code == 400, chunk_size
+        assert response.get_json() == {"message": "chunk_size must be a positive integer"}
+    assert client.get("/products").get_json() == []
+
+
+def test_bulk_order_lines_report_unknown_and_repeated_products(client, seed_catalog):
+    seed_catalog(products=3, orders=[[1]])
+    response = client.post("/orders/1/products?chunk_size=1", json=[
+        2, 99, 1, {"product_id": 3, "quantity": 4}, 2, {"product_id": 3, "quantity": 0}, "x"
+    ])
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["inserted"] == 2
+    assert body["errors"]["1"] == {"product_id": ["Product ID 99 not found"]}
+    assert body["errors"]["2"] == {"product_id": ["Product ID 1 is already in Order ID 1"]}
+    assert body["errors"]["4"] == {"product_id": ["Product ID 2 is already in Order ID 1"]}
+    assert set(body["errors"]) == {"1", "2", "4", "5", "6"}
+    lines = client.get("/orders/1/products").get_json()
+    assert [(line["id"], line["quantity"]) for line in lines] == [(1, 1), (2, 1), (3, 4)]
+
+    assert client.post("/orders/9/products", json=[1]).status_code == 400
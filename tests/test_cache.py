@@ -0,0 +1,54 @@
+from app import LRUCache, Product, cache, cache_entry, cache_key, db, product_schema
+
+
+def test_writes_invalidate_cached_products(client):
+    client.post("/products", json={"product_name": "lamp", "price": 10})
+    assert client.get("/products/1").get_json()["product_name"] == "lamp"
+
+    client.put("/products/1", json={"product_name": "desk lamp", "price": 12})
+    assert client.get("/products/1").get_json()["product_name"] == "desk lamp"
+
+    # A non-canonical id in the path still evicts the cached entry for product 1
+    assert client.delete("/products/01").status_code == 200
+    assert client.get("/products/1").status_code == 400
+
+
+def test_writes_invalidate_cached_users(client):
+    client.post("/users", json={"name": "Ada", "address": "1 Main St", "email": "ada@example.com"})
+    assert client.get("/users/1").get_json()["name"] == "Ada"
+
+    client.put("/users/1", json={"name": "Ada L", "address": "1 Main St", "email": "ada@example.com"})
+    assert client.get("/users/1").get_json()["name"] == "Ada L"
+
+    client.delete("/users/1")
+    assert client.get("/users/1").status_code == 400
+
+
+def test_reader_that_loaded_before_a_write_cannot_cache_the_old_row(client):
+    client.post("/products", json={"product_name": "lamp", "price": 10})
+    # A reader missed the cache and loaded version 1...
+    stale = cache_entry(db.session.get(Product, 1), product_schema)
+    db.session.expire_all()
+
+    # ...then a write committed and invalidated before the reader stored what it loaded
+    client.put("/products/1", json={"product_name": "desk lamp", "price": 12})
+    cache.set(cache_key(Product, 1), stale)
+    assert client.get("/products/1").get_json()["product_name"] == "desk lamp"
+
+    client.delete("/products/1")
+    cache.set(cache_key(Product, 1), stale)
+    assert client.get("/products/1").status_code == 400
+
+
+def test_lru_keeps_the_newest_version():
+    lru = LRUCache(max_size=10, ttl=60)
+    lru.set("k", {"version": 2, "data": "new"})
+    lru.set("k", {"version": 1, "data": "old"})
+    assert lru.get("k")["data"] == "new"
+
+    lru.invalidate("k", 3)
+    assert lru.get("k") is None
+    lru.set("k", {"version": 2, "data": "new"})
+    assert lru.get("k") is None
+    lru.set("k", {"version": 3, "data": "newest"})
+    assert lru.get("k")["data"] == "newest"
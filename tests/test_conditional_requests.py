@@ -0,0 +1,94 @@
+from test_query_counts import count_statements
+
+
+def etag(client, url):
+    response = client.get(url)
+    assert response.status_code == 200
+    return response.headers["ETag"]
+
+
+def assert_not_modified(client, url, tag):
+    response = client.get(url, headers={"If-None-Match": tag})
+    assert response.status_code == 304
+    assert response.get_data() == b""
+
+
+def test_if_none_match_returns_304(client, seed_catalog):
+    seed_catalog(products=3, orders=[[1]])
+    for url in ["/products", "/products/1", "/orders/1/products"]:
+        assert_not_modified(client, url, etag(client, url))
+
+
+def test_product_listing_ignores_if_modified_since(client, seed_catalog):
+    seed_catalog(products=3, orders=[[1]])
+    response = client.get("/products")
+    assert "Last-Modified" not in response.headers
+    assert client.get("/products", headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}).status_code == 200
+
+
+def test_add_product_changes_the_order_etag(client, seed_catalog):
+    seed_catalog(products=3, orders=[[1]])
+    before = etag(client, "/orders/1/products")
+    client.get("/orders/1/add_product/2")
+    assert client.get("/orders/1/products", headers={"If-None-Match": before}).status_code == 200
+    assert etag(client, "/orders/1/products") != before
+
+
+def test_update_product_changes_product_etags(client, seed_catalog):
+    seed_catalog(products=3, orders=[[1]])
+    urls = ["/products", "/products/1", "/orders/1/products"]
+    before = {url: etag(client, url) for url in urls}
+    client.put("/products/1", json={"product_name": "renamed", "price": 9})
+    for url in urls:
+        response = client.get(url, headers={"If-None-Match": before[url]})
+        assert response.status_code == 200, url
+        assert response.headers["ETag"] != before[url]
+
+
+def test_delete_product_changes_listing_and_order_etags(client, seed_catalog):
+    seed_catalog(products=3, orders=[[1]])
+    urls = ["/products", "/orders/1/products"]
+    before = {url: etag(client, url) for url in urls}
+    client.delete("/products/1")
+    assert client.get("/products", headers={"If-None-Match": before["/products"]}).status_code == 200
+    # The order lost its only product
+    assert client.get("/orders/1/products", headers={"If-None-Match": before["/orders/1/products"]}).status_code == 400
+
+
+def test_recreated_product_with_a_reused_id_gets_a_new_etag(client, seed_catalog):
+    seed_catalog(products=2)
+    before = etag(client, "/products/2")
+    client.delete("/products/2")
+    # SQLite reuses the highest id, and the new row starts again at version 1
+    assert client.post("/products", json={"product_name": "replacement", "price": 5}).get_json()["id"] == 2
+
+    response = client.get("/products/2", headers={"If-None-Match": before})
+    assert response.status_code == 200
+    assert response.get_json()["product_name"] == "replacement"
+    assert response.headers["ETag"] != before
+
+
+def test_product_page_etag_covers_only_the_fetched_rows(client, seed_catalog):
+    seed_catalog(products=6)
+    url = "/products?limit=2&after=2"
+    before = etag(client, url)
+    assert_not_modified(client, url, before)
+
+    # Outside the page (and past its lookahead row): same tag
+    client.put("/products/6", json={"product_name": "renamed", "price": 9})
+    assert_not_modified(client, url, before)
+
+    # The lookahead row decides the next link, so it is part of the tag
+    client.delete("/products/5")
+    assert client.get(url, headers={"If-None-Match": before}).status_code == 200
+    before = etag(client, url)
+    client.put("/products/3", json={"product_name": "renamed", "price": 9})
+    assert client.get(url, headers={"If-None-Match": before}).status_code == 200
+
+
+def test_invalid_page_bounds_are_rejected_before_any_query(client, seed_catalog):
+    seed_catalog(products=1)
+    with count_statements() as statements:
+        response = client.get("/products?limit=0")
+    assert response.status_code == 400
+    assert statements == []
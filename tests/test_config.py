@@ -0,0 +1,69 @@
+import pytest
+from flask import Config
+from sqlalchemy import text
+
+from app import app, db, load_settings
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    # Only the variables a test sets (conftest's database URI included) reach load_settings
+    monkeypatch.delenv("ECOMMERCE_SQLALCHEMY_DATABASE_URI")
+    monkeypatch.delenv("ECOMMERCE_API_SETTINGS", raising=False)
+    config = Config(str(tmp_path))
+    config.update(SQLALCHEMY_DATABASE_URI="sqlite:///ecommerce.db", SQLALCHEMY_ENGINE_OPTIONS={}, CACHE_TTL=300)
+    return config
+
+
+def test_default_database_is_sqlite_without_credentials(config):
+    load_settings(config)
+    assert config["SQLALCHEMY_DATABASE_URI"] == "sqlite:///ecommerce.db"
+    assert config["SQLALCHEMY_ENGINE_OPTIONS"] == {}
+
+
+def test_environment_overrides_are_parsed_as_json(config, monkeypatch):
+    monkeypatch.setenv("ECOMMERCE_CACHE_TTL", "60")
+    monkeypatch.setenv("ECOMMERCE_SQLALCHEMY_DATABASE_URI", "mysql+mysqlconnector://api@db/shop")
+    monkeypatch.setenv("ECOMMERCE_SQLALCHEMY_ENGINE_OPTIONS__pool_size", "25")
+    load_settings(config)
+
+    assert config["CACHE_TTL"] == 60
+    assert config["SQLALCHEMY_DATABASE_URI"] == "mysql+mysqlconnector://api@db/shop"
+    # The nested override is kept and the other pool defaults fill in around it
+    assert config["SQLALCHEMY_ENGINE_OPTIONS"] == {
+        "pool_size": 25, "max_overflow": 20, "pool_timeout": 30, "pool_recycle": 1800, "pool_pre_ping": True
+    }
+
+
+def test_settings_file_is_applied_before_the_environment(config, monkeypatch, tmp_path):
+    settings = tmp_path / "settings.py"
+    settings.write_text('SQLALCHEMY_DATABASE_URI = "mysql+mysqlconnector://api@db/shop"\n'
+                        'SQLALCHEMY_ENGINE_OPTIONS = {"pool_recycle": 900}\nCACHE_TTL = 30\n')
+    monkeypatch.setenv("ECOMMERCE_API_SETTINGS", str(settings))
+    monkeypatch.setenv("ECOMMERCE_CACHE_TTL", "45")
+    load_settings(config)
+
+    assert config["CACHE_TTL"] == 45
+    assert config["SQLALCHEMY_ENGINE_OPTIONS"]["pool_recycle"] == 900
+    assert config["SQLALCHEMY_ENGINE_OPTIONS"]["pool_size"] == 10
+
+
+def test_sqlite_gets_no_pool_defaults(config, monkeypatch):
+    monkeypatch.setenv("ECOMMERCE_SQLALCHEMY_DATABASE_URI", "sqlite://")
+    load_settings(config)
+    assert config["SQLALCHEMY_ENGINE_OPTIONS"] == {}
+    assert app.config["SQLALCHEMY_ENGINE_OPTIONS"] == {}
+
+
+def test_pool_stats_count_checkouts_and_checkins(client):
+    db.session.remove()
+    before = client.get("/db/pool/stats").get_json()
+    for _ in range(3):
+        with db.engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    after = client.get("/db/pool/stats").get_json()
+
+    assert after["checkouts"] - before["checkouts"] == 3
+    assert after["checkins"] - before["checkins"] == 3
+    assert after["held_seconds"] > before["held_seconds"]
+    assert after["pool_class"] == type(db.engine.pool).__name__
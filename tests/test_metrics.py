@@ -0,0 +1,94 @@
+import logging
+import re
+import time
+
+import pytest
+from marshmallow import fields
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+import app as app_module
+from app import app, db, request_metrics
+
+
+@pytest.fixture
+def metrics(client, monkeypatch):
+    monkeypatch.setitem(app.config, "METRICS_ENABLED", True)
+    for key, value in request_metrics.items():
+        if key == "slow_queries":
+            request_metrics[key] = 0
+        else:
+            value.clear()
+    return request_metrics
+
+
+def server_timing(response):
+    return {name: float(duration) for name, duration in re.findall(r"(\w+);dur=([\d.]+)", response.headers["Server-Timing"])}
+
+
+def test_server_timing_reports_queries_and_serialization(client, seed_catalog, metrics):
+    seed_catalog(products=3)
+    response = client.get("/products/1")
+    assert set(server_timing(response)) == {"app", "db", "serialize"}
+    assert 'desc="1 queries"' in response.headers["Server-Timing"]
+    assert metrics["queries"][("/products/<int:id>", "GET")] == 1
+
+
+def test_fast_list_formatting_counts_as_serialization(client, seed_catalog, metrics, monkeypatch):
+    seed_catalog(products=3)
+
+    def slow_str(value):
+        time.sleep(0.01)
+        return str(value)
+    # Rebuild the field plans with a formatter slow enough to show up in the totals
+    monkeypatch.setitem(app_module.FAST_FORMATTERS, fields.String, slow_str)
+    monkeypatch.setattr(app_module, "field_plans", {})
+
+    assert app.config["FAST_SERIALIZER"]
+    response = client.get("/products")
+    assert response.status_code == 200
+    assert metrics["serialize_seconds"][("/products", "GET")] >= 0.03
+    assert server_timing(response)["serialize"] >= 30
+
+
+def test_metrics_endpoint_exports_route_totals(client, seed_catalog, metrics):
+    seed_catalog(products=1)
+    client.get("/products/1")
+    client.get("/products/2")
+
+    body = client.get("/metrics").get_data(as_text=True)
+    assert 'ecommerce_requests_total{route="/products/<int:id>",method="GET",status="200"} 1' in body
+    assert 'ecommerce_requests_total{route="/products/<int:id>",method="GET",status="400"} 1' in body
+    assert 'ecommerce_request_duration_seconds_count{route="/products/<int:id>",method="GET"} 2' in body
+    assert 'ecommerce_db_queries_total{route="/products/<int:id>",method="GET"} 2' in body
+    assert "ecommerce_slow_queries_total 0" in body
+
+
+def test_metrics_endpoint_is_off_by_default(client):
+    assert client.get("/metrics").status_code == 404
+    assert "Server-Timing" not in client.get("/users").headers
+
+
+def test_slow_queries_are_logged_and_counted(client, seed_catalog, metrics, monkeypatch, caplog):
+    seed_catalog(products=1)
+    monkeypatch.setitem(app.config, "SLOW_QUERY_THRESHOLD", 0)
+    with caplog.at_level(logging.WARNING, logger="ecommerce.slow_query"):
+        client.get("/products/1")
+    assert metrics["slow_queries"] == 1
+    assert "/products/1: SELECT" in caplog.records[0].getMessage()
+
+
+# Per-statement bookkeeping kept on the pooled connection would grow by one entry per failed statement
+def connection_lists():
+    return {key: len(value) for key, value in db.session.connection().info.items() if isinstance(value, list)}
+
+
+def test_failed_statements_leave_nothing_on_the_connection(client, metrics):
+    db.session.execute(text("SELECT 1"))
+    before = connection_lists()
+    for _ in range(3):
+        with pytest.raises(OperationalError):
+            db.session.execute(text("SELECT * FROM missing_table"))
+        db.session.rollback()
+    db.session.execute(text("SELECT 1"))
+    assert connection_lists() == before
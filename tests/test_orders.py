@@ -0,0 +1,94 @@
+from datetime import timedelta
+
+import hashlib
+import json
+
+from sqlalchemy import insert, select
+
+import app as app_module
+from app import IdempotencyKey, Order, db, order_product, utcnow
+
+
+def test_new_idempotency_key_purges_expired_keys(client, seed_catalog):
+    seed_catalog(products=1)
+    expired = utcnow() - timedelta(days=2)
+    db.session.execute(insert(IdempotencyKey), [
+        {"key": f"old-{i}", "request_hash": "x", "status_code": 200, "response_body": "{}", "created_at": expired}
+        for i in range(3)
+    ])
+    db.session.commit()
+
+    response = client.post("/orders", json={"user_id": 1}, headers={"Idempotency-Key": "new"})
+    assert response.status_code == 200
+    assert db.session.execute(select(IdempotencyKey.key)).scalars().all() == ["new"]
+
+
+def order_lines():
+    return db.session.execute(select(order_product.c.order_id, order_product.c.product_id, order_product.c.quantity)).all()
+
+
+def test_create_order_with_products_is_atomic(client, seed_catalog):
+    seed_catalog(products=3)
+
+    response = client.post("/orders", json={"user_id": 1, "products": [1, {"product_id": 2, "quantity": 3}, 1]})
+    assert response.status_code == 200
+    assert response.get_json()["products"] == [{"product_id": 1, "quantity": 2}, {"product_id": 2, "quantity": 3}]
+    assert order_lines() == [(1, 1, 2), (1, 2, 3)]
+    assert client.get("/orders/1/summary").get_json()["total"] == 1 * 2 + 2 * 3
+
+    # One unknown product rejects the whole order: no order row and no lines
+    response = client.post("/orders", json={"user_id": 1, "products": [3, 99]})
+    assert response.status_code == 400
+    assert db.session.execute(select(Order.id)).scalars().all() == [1]
+    assert len(order_lines()) == 2
+
+
+def test_idempotency_key_replays_the_original_order(client, seed_catalog):
+    seed_catalog(products=1)
+    headers = {"Idempotency-Key": "checkout-1"}
+    body = {"user_id": 1, "products": [1]}
+
+    first = client.post("/orders", json=body, headers=headers)
+    retry = client.post("/orders", json=body, headers=headers)
+    assert retry.status_code == 200
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert retry.get_data() == first.get_data()
+    assert db.session.execute(select(Order.id)).scalars().all() == [1]
+
+    conflict = client.post("/orders", json={"user_id": 1}, headers=headers)
+    assert conflict.status_code == 409
+
+
+def test_idempotency_key_longer_than_the_column_is_rejected(client, seed_catalog):
+    seed_catalog(products=1)
+    response = client.post("/orders", json={"user_id": 1}, headers={"Idempotency-Key": "k" * 256})
+    assert response.status_code == 400
+    assert client.post("/orders", json={"user_id": 1}, headers={"Idempotency-Key": "k" * 255}).status_code == 200
+
+
+def test_concurrent_retry_that_commits_first_is_replayed(client, seed_catalog, monkeypatch):
+    seed_catalog(products=1)
+    data = json.dumps({"user_id": 1}).encode()
+    stored = {"id": 42, "user_id": 1}
+    real_replay = app_module.replay_idempotent_response
+    calls = []
+
+    # The other request stores the key after this one checked for it, so this one's commit hits the primary key
+    def replay_after_race(key, request_hash):
+        calls.append(key)
+        if len(calls) == 1:
+            db.session.execute(insert(IdempotencyKey).values(
+                key=key, request_hash=hashlib.sha256(data).hexdigest(), status_code=200, response_body=json.dumps(stored)
+            ))
+            db.session.commit()
+            return None
+        return real_replay(key, request_hash)
+
+    monkeypatch.setattr(app_module, "replay_idempotent_response", replay_after_race)
+    response = client.post("/orders", data=data, content_type="application/json", headers={"Idempotency-Key": "race"})
+
+    assert len(calls) == 2
+    assert response.status_code == 200
+    assert response.get_json() == stored
+    assert response.headers["Idempotent-Replayed"] == "true"
+    assert db.session.execute(select(Order.id)).scalars().all() == []
@@ -0,0 +1,71 @@
+import json
+
+
+def ndjson(response):
+    assert response.status_code == 200, response.get_data(as_text=True)
+    assert response.mimetype == "application/x-ndjson"
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def test_keyset_pages_follow_next_links(client, seed_catalog):
+    seed_catalog(products=5)
+
+    first = client.get("/products?limit=2")
+    body = first.get_json()
+    assert [product["id"] for product in body["items"]] == [1, 2]
+    assert body["next"] == "/products?limit=2&after=2"
+    assert first.headers["Link"] == '</products?limit=2&after=2>; rel="next"'
+
+    ids = [product["id"] for product in body["items"]]
+    while body["next"]:
+        body = client.get(body["next"]).get_json()
+        ids += [product["id"] for product in body["items"]]
+    assert ids == [1, 2, 3, 4, 5]
+
+    last = client.get("/products?limit=2&after=4")
+    assert last.get_json() == {"items": [{"id": 5, "product_name": "product 4", "price": 5.0}], "next": None}
+    assert "Link" not in last.headers
+
+
+def test_next_link_keeps_filters(client, seed_catalog):
+    seed_catalog(products=5)
+    body = client.get("/products?max_price=4&limit=2").get_json()
+    assert body["next"] == "/products?max_price=4&limit=2&after=2"
+    assert [product["id"] for product in client.get(body["next"]).get_json()["items"]] == [3, 4]
+
+
+def test_page_parameters_are_validated(client, seed_catalog):
+    seed_catalog(products=1)
+    for query in ["limit=0", "limit=1001", "limit=x", "after=x"]:
+        assert client.get(f"/users?{query}").status_code == 400, query
+
+
+def test_user_orders_page_ignores_a_path_named_query_parameter(client, seed_catalog):
+    seed_catalog(products=1, orders=[[1], [1], [1]])
+    # ?user_id= clashes with the route's <user_id> argument when building the next link
+    response = client.get("/orders/user/1?limit=2&user_id=7")
+    assert response.status_code == 200
+    body = response.get_json()
+    assert [order["id"] for order in body["items"]] == [1, 2]
+    assert body["next"] == "/orders/user/1?limit=2&after=2"
+
+
+def test_ndjson_streams_every_row(client, seed_catalog):
+    seed_catalog(products=3, orders=[[1, 2]])
+
+    assert ndjson(client.get("/products?format=ndjson")) == client.get("/products").get_json()
+    assert ndjson(client.get("/users", headers={"Accept": "application/x-ndjson"})) == client.get("/users").get_json()
+    orders = ndjson(client.get("/orders/user/1?format=ndjson&expand=products"))
+    assert [product["id"] for product in orders[0]["products"]] == [1, 2]
+
+
+def test_ndjson_with_page_parameters_streams_only_that_page(client, seed_catalog):
+    seed_catalog(products=5, orders=[[1], [1], [1]])
+
+    assert [row["id"] for row in ndjson(client.get("/products?format=ndjson&limit=2&after=1"))] == [2, 3]
+    streamed = client.get("/users?after=0", headers={"Accept": "application/x-ndjson"})
+    assert [row["id"] for row in ndjson(streamed)] == [1]
+    assert [row["id"] for row in ndjson(client.get("/orders/user/1?format=ndjson&limit=1&after=1"))] == [2]
+
+    assert client.get("/products?format=ndjson&limit=0").status_code == 400
+    assert client.get("/products?format=ndjson&limit=2&sort=price").status_code == 400
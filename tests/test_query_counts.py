@@ -0,0 +1,73 @@
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app import db
+
+
+@contextmanager
+def count_statements():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+
+def seed_orders(client, orders, products_per_order):
+    for _ in range(orders):
+        response = client.post("/orders", json={"user_id": 1, "products": list(range(1, products_per_order + 1))})
+        assert response.status_code == 200, response.get_json()
+
+
+def statements_for(client, method, url):
+    with count_statements() as statements:
+        response = client.open(url, method=method)
+    assert response.status_code == 200, response.get_json()
+    return len(statements)
+
+
+def test_expand_products_query_count_does_not_grow_with_orders(client, seed_catalog):
+    seed_catalog(products=3)
+    seed_orders(client, orders=1, products_per_order=3)
+    one = statements_for(client, "GET", "/orders/user/1?expand=products")
+    seed_orders(client, orders=20, products_per_order=3)
+    many = statements_for(client, "GET", "/orders/user/1?expand=products")
+
+    # orders, then one selectinload for every order's products
+    assert one == many == 2
+    orders = client.get("/orders/user/1?expand=products").get_json()
+    assert len(orders) == 21
+    assert [(product["id"], product["quantity"]) for product in orders[0]["products"]] == [(1, 1), (2, 1), (3, 1)]
+
+
+def test_add_product_query_count_does_not_grow_with_order_size(client, seed_catalog):
+    seed_catalog(products=51)
+    seed_orders(client, orders=1, products_per_order=1)
+    small = statements_for(client, "GET", "/orders/1/add_product/2")
+
+    client.post("/orders/1/products", json=list(range(3, 51)))
+    large = statements_for(client, "GET", "/orders/1/add_product/51")
+
+    # order, product (cache miss), EXISTS, INSERT, version bump
+    assert small == large == 5
+    assert client.get("/orders/1/add_product/51").status_code == 400
+
+
+def test_delete_order_product_query_count_does_not_grow_with_order_size(client, seed_catalog):
+    seed_catalog(products=50)
+    seed_orders(client, orders=1, products_per_order=2)
+    small = statements_for(client, "DELETE", "/orders/1/remove_product/1")
+
+    seed_orders(client, orders=1, products_per_order=50)
+    large = statements_for(client, "DELETE", "/orders/2/remove_product/1")
+
+    # EXISTS, DELETE, version bump
+    assert small == large == 3
+    assert client.delete("/orders/1/remove_product/1").status_code == 400
+    assert [product["id"] for product in client.get("/orders/2/products").get_json()] == list(range(2, 51))
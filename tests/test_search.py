@@ -0,0 +1,88 @@
+from sqlalchemy import insert, select, text
+
+from app import Product, db, product_filters
+
+
+def search(client, q, **params):
+    response = client.get("/products", query_string={"q": q, "mode": "fulltext", **params})
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()
+
+
+def names(client, q):
+    return [product["product_name"] for product in search(client, q)]
+
+
+def test_fulltext_matches_word_prefixes(client):
+    for name in ["red apple", "green apple", "blue pear"]:
+        client.post("/products", json={"product_name": name, "price": 1})
+
+    assert names(client, "app") == ["red apple", "green apple"]
+    assert names(client, "APP gre") == ["green apple"]
+    assert names(client, "ple") == []
+    assert names(client, "!!!") == []
+
+
+def test_fulltext_follows_updates_and_deletes(client):
+    client.post("/products", json={"product_name": "red apple", "price": 1})
+    client.post("/products", json={"product_name": "cafe latte", "price": 2})
+
+    client.put("/products/1", json={"product_name": "red cherry", "price": 1})
+    assert names(client, "app") == []
+    assert names(client, "cher") == ["red cherry"]
+
+    # SQLite reuses the highest id after a delete; the new row must not inherit the old name's matches
+    client.delete("/products/2")
+    response = client.post("/products", json={"product_name": "glass mug", "price": 3})
+    assert response.get_json()["id"] == 2
+    assert names(client, "glass") == ["glass mug"]
+    assert names(client, "caf") == []
+
+
+def test_fulltext_with_more_matches_than_sql_variables(client):
+    db.session.execute(insert(Product), [{"product_name": f"steel lamp {i}", "price": 1} for i in range(40000)])
+    db.session.commit()
+
+    page = search(client, "steel", limit=5)
+    assert [product["id"] for product in page["items"]] == [1, 2, 3, 4, 5]
+    assert len(search(client, "steel")) == 40000
+
+
+def prefix_names(client, q):
+    response = client.get("/products", query_string={"q": q})
+    assert response.status_code == 200, response.get_json()
+    return [product["product_name"] for product in response.get_json()]
+
+
+def product_filters_for(client, q):
+    with client.application.test_request_context("/products", query_string={"q": q}):
+        criteria, _, error = product_filters()
+    assert error is None
+    return criteria
+
+
+def test_prefix_is_case_sensitive_and_literal(client):
+    for name in ["P1 lamp", "p1 mug", "P10 desk", "100% cotton", "1000 pins"]:
+        client.post("/products", json={"product_name": name, "price": 1})
+
+    assert prefix_names(client, "P1") == ["P1 lamp", "P10 desk"]
+    assert prefix_names(client, "p1") == ["p1 mug"]
+    assert prefix_names(client, "100%") == ["100% cotton"]
+
+
+def test_prefix_uses_the_product_name_index(client):
+    query = select(Product.id).where(*product_filters_for(client, "P1"))
+    plan = db.session.execute(text(f"EXPLAIN QUERY PLAN {query.compile(compile_kwargs={'literal_binds': True})}")).all()
+    assert any("ix_app_products_product_name" in row[-1] for row in plan), plan
+
+
+def test_price_bounds_must_be_finite_numbers(client):
+    client.post("/products", json={"product_name": "lamp", "price": 10})
+    client.post("/products", json={"product_name": "desk", "price": 99})
+
+    assert [product["id"] for product in client.get("/products?min_price=50").get_json()] == [2]
+    assert [product["id"] for product in client.get("/products?min_price=1e1&max_price=10").get_json()] == [1]
+    for query in ["min_price=cheap", "min_price=nan", "max_price=inf", "min_price=-Infinity", "max_price=1e999"]:
+        response = client.get(f"/products?{query}")
+        assert response.status_code == 400, query
+        assert response.get_json() == {"message": "min_price and max_price must be numbers"}
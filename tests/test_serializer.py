@@ -0,0 +1,19 @@
+import pytest
+
+from app import app
+
+
+@pytest.mark.parametrize("url", ["/users", "/products", "/orders/user/1"])
+def test_fast_serializer_matches_schema_jsonify_byte_for_byte(client, seed_catalog, monkeypatch, url):
+    seed_catalog(products=3, orders=[[1], [2, 3]])
+    client.post("/users", json={"name": "Zoë «Ω»", "address": "2 Rue d'Été", "email": "zoe@example.com"})
+    client.post("/products", json={"product_name": "café ☕", "price": 0.1 + 0.2})
+
+    monkeypatch.setitem(app.config, "FAST_SERIALIZER", False)
+    expected = client.get(url)
+    monkeypatch.setitem(app.config, "FAST_SERIALIZER", True)
+    actual = client.get(url)
+
+    assert expected.status_code == actual.status_code == 200
+    assert actual.mimetype == expected.mimetype
+    assert actual.get_data() == expected.get_data()